@@ -11,7 +11,8 @@ web example. It runs a simple voice AI bot that you can connect to using a
 web browser and speak with it.
 
 Required AI services:
-    - Deepgram (Speech-to-Text)
+    - Deepgram (Speech-to-Text), or a local sherpa-onnx model when
+      ``LOCAL_ASR_DIR`` is set
     - OpenAI (LLM)
 - Cartesia (Text-to-Speech)
 
@@ -23,9 +24,12 @@ Run the bot using::
 """
 
 import os
+from functools import lru_cache
 
+import httpx
 from dotenv import load_dotenv
 from loguru import logger
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 from pipecat.audio.vad.silero import SileroVADAnalyzer
 from pipecat.pipeline.pipeline import Pipeline
@@ -42,31 +46,84 @@ from pipecat.transports.network.small_webrtc import SmallWebRTCTransport
 
 load_dotenv(override=True)
 
+# Configuration is read once at import; run_bot() only builds per-session state.
+DEEPGRAM_API_KEY = os.getenv("DEEPGRAM_API_KEY")
+GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
+GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+LOCAL_ASR_DIR = os.getenv("LOCAL_ASR_DIR")
+
+if LOCAL_ASR_DIR:
+    # sherpa-onnx is an optional dependency, only needed for local STT. Loading
+    # the model here makes a missing package or a bad LOCAL_ASR_DIR fail at boot
+    # and keeps the load off the event loop once sessions are running.
+    from local_stt import SherpaOnnxSTTService, get_recognizer
+
+    get_recognizer(LOCAL_ASR_DIR)
+
+GEMINI_BASE_URL = "https://generativelanguage.googleapis.com/v1beta/openai/"
+GEMINI_MODEL = "gemini-1.5-flash"
+GROQ_TTS_MODEL = "playai-tts"
+GROQ_TTS_VOICE = "Celeste-PlayAI"
+
+SYSTEM_PROMPT = (
+    "You are a friendly AI assistant. Always respond in English only. Keep your answers "
+    "conversational and natural. Never use any language other than English."
+)
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client used for LLM requests."""
+    return DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_keepalive_connections=100, max_connections=1000, keepalive_expiry=None
+        )
+    )
 
-async def run_bot(transport: BaseTransport):
-    logger.info(f"Starting bot")
 
-    stt = DeepgramSTTService(api_key=os.getenv("DEEPGRAM_API_KEY"))
+class GeminiLLMService(OpenAILLMService):
+    """Gemini through its OpenAI-compatible endpoint on a shared connection pool.
+
+    Every session still gets its own service instance, but they all reuse the
+    same keep-alive connections, so only the first session pays for DNS and the
+    TLS handshake.
+    """
+
+    def create_client(
+        self,
+        api_key=None,
+        base_url=None,
+        organization=None,
+        project=None,
+        default_headers=None,
+        **kwargs,
+    ):
+        return AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            organization=organization,
+            project=project,
+            http_client=get_http_client(),
+            default_headers=default_headers,
+        )
 
-    
 
-    llm = OpenAILLMService(
-        api_key=os.getenv("GOOGLE_API_KEY"),
-        base_url="https://generativelanguage.googleapis.com/v1beta/openai/",
-        model="gemini-1.5-flash"
-    )
+async def run_bot(transport: BaseTransport):
+    logger.info("Starting bot")
 
-    
-    tts = GroqTTSService(
-        api_key=os.getenv("GROQ_API_KEY"),
-        model_name="playai-tts",
-        voice_id="Celeste-PlayAI"
-    )
+    if LOCAL_ASR_DIR:
+        stt = SherpaOnnxSTTService(model_dir=LOCAL_ASR_DIR)
+    else:
+        stt = DeepgramSTTService(api_key=DEEPGRAM_API_KEY)
+
+    llm = GeminiLLMService(api_key=GOOGLE_API_KEY, base_url=GEMINI_BASE_URL, model=GEMINI_MODEL)
+
+    tts = GroqTTSService(api_key=GROQ_API_KEY, model_name=GROQ_TTS_MODEL, voice_id=GROQ_TTS_VOICE)
 
     messages = [
         {
             "role": "system",
-            "content": "You are a friendly AI assistant. Always respond in English only. Keep your answers conversational and natural. Never use any language other than English.",
+            "content": SYSTEM_PROMPT,
         },
     ]
 
@@ -99,14 +156,14 @@ async def run_bot(transport: BaseTransport):
 
     @transport.event_handler("on_client_connected")
     async def on_client_connected(transport, client):
-        logger.info(f"Client connected")
+        logger.info("Client connected")
         # Kick off the conversation.
         messages.append({"role": "system", "content": "Say hello and briefly introduce yourself."})
         await task.queue_frames([context_aggregator.user().get_context_frame()])
 
     @transport.event_handler("on_client_disconnected")
     async def on_client_disconnected(transport, client):
-        logger.info(f"Client disconnected")
+        logger.info("Client disconnected")
         await task.cancel()
 
     runner = PipelineRunner(handle_sigint=False)
@@ -1,5 +1,12 @@
 import os
-from pipecat.frames.frames import EndFrame, TTSSpeakFrame, LLMRunFrame, LLMMessagesAppendFrame
+from pipecat.frames.frames import (
+    EndFrame,
+    Frame,
+    LLMMessagesAppendFrame,
+    LLMRunFrame,
+    TTSSpeakFrame,
+    UserStartedSpeakingFrame,
+)
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.task import PipelineTask
 from pipecat.services.openai import OpenAILLMService
@@ -22,15 +29,27 @@ async def main():
 
     # Custom Frame Processor using queue_frames
     class CustomProcessor(FrameProcessor):
+        def __init__(self):
+            super().__init__()
+            # Keyed by exact frame type: one dict probe per frame instead of an
+            # isinstance() chain.
+            self._handlers = {
+                UserStartedSpeakingFrame: self._on_user_started_speaking,
+            }
+
+        # 4. CUSTOM FRAME PROCESSOR - React to specific frames
+        async def _on_user_started_speaking(self, frame: Frame):
+            await task.queue_frames([
+                TTSSpeakFrame("I hear you speaking..."),
+            ])
+
         async def process_frame(self, frame: Frame, direction: FrameDirection):
             await super().process_frame(frame, direction)
-            
-            # 4. CUSTOM FRAME PROCESSOR - React to specific frames
-            if isinstance(frame, UserStartedSpeakingFrame):
-                await task.queue_frames([
-                    TTSSpeakFrame("I hear you speaking..."),
-                ])
-            
+
+            handler = self._handlers.get(type(frame))
+            if handler:
+                await handler(frame)
+
             await self.push_frame(frame, direction)
 
     custom_processor = CustomProcessor()
@@ -113,11 +132,25 @@ The task object must be accessible in the scope where you call queue_frames(). T
 
 
 
+import asyncio
 import os
-from pipecat.frames.frames import EndFrame, TTSSpeakFrame, LLMRunFrame, LLMMessagesAppendFrame
+from typing import ClassVar
+
+from pipecat.frames.frames import (
+    EndFrame,
+    ErrorFrame,
+    FatalErrorFrame,
+    Frame,
+    LLMFullResponseEndFrame,
+    LLMMessagesAppendFrame,
+    LLMRunFrame,
+    TTSSpeakFrame,
+    UserStoppedSpeakingFrame,
+)
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.task import PipelineTask
 from pipecat.services.openai.llm import OpenAILLMService
+from pipecat.services.ollama.llm import OLLamaLLMService
 from pipecat.services.cartesia import CartesiaTTSService
 from pipecat.transports.services.daily import DailyTransport, DailyParams
 from pipecat.processors.frame_processor import FrameProcessor, FrameDirection
@@ -127,7 +160,11 @@ from pipecat.adapters.schemas.tools_schema import ToolsSchema
 
 async def main():
     # Create services
-    llm = OpenAILLMService(api_key=os.getenv("OPENAI_API_KEY"))
+    if os.getenv("LLM_BACKEND") == "ollama":
+        # Q4_K_M keeps local decode fast; pick a Q8_0 tag when accuracy matters more
+        llm = OLLamaLLMService(model=os.getenv("OLLAMA_MODEL", "llama3.1:8b-instruct-q4_K_M"))
+    else:
+        llm = OpenAILLMService(api_key=os.getenv("OPENAI_API_KEY"))
     tts = CartesiaTTSService(api_key=os.getenv("CARTESIA_API_KEY"))
     
     transport = DailyTransport(
@@ -139,42 +176,57 @@ async def main():
 
     # CUSTOM FRAME PROCESSOR - Multiple use cases
     class SmartProcessor(FrameProcessor):
+        SILENCE_PROMPT_THRESHOLD: ClassVar[int] = 3
+        SUMMARY_INTERVAL: ClassVar[int] = 5
+
         def __init__(self):
             super().__init__()
             self.silence_count = 0
             self.conversation_turns = 0
+            # Keyed by exact frame type, so subclasses we care about (like
+            # FatalErrorFrame) are listed explicitly.
+            self._handlers = {
+                UserStoppedSpeakingFrame: self._on_user_stopped_speaking,
+                LLMFullResponseEndFrame: self._on_llm_response_end,
+                ErrorFrame: self._on_error,
+                FatalErrorFrame: self._on_error,
+            }
+
+        # USE CASE 1: Detect user silence and encourage engagement
+        async def _on_user_stopped_speaking(self, frame: Frame):
+            self.silence_count += 1
+            if self.silence_count >= self.SILENCE_PROMPT_THRESHOLD:
+                await task.queue_frames([
+                    TTSSpeakFrame("I'm here if you need anything else!"),
+                ])
+                self.silence_count = 0
 
-        async def process_frame(self, frame: Frame, direction: FrameDirection):
-            await super().process_frame(frame, direction)
-            
-            # USE CASE 1: Detect user silence and encourage engagement
-            if isinstance(frame, UserStoppedSpeakingFrame):
-                self.silence_count += 1
-                if self.silence_count >= 3:
-                    await task.queue_frames([
-                        TTSSpeakFrame("I'm here if you need anything else!"),
-                    ])
-                    self.silence_count = 0
-            
-            # USE CASE 2: Track conversation flow and offer summaries
-            if isinstance(frame, LLMFullResponseEndFrame):
-                self.conversation_turns += 1
-                if self.conversation_turns % 5 == 0:  # Every 5 exchanges
-                    await task.queue_frames([
-                        TTSSpeakFrame("Would you like me to summarize our conversation?"),
-                        LLMMessagesAppendFrame([{
-                            "role": "system",
-                            "content": "Ask if the user wants a conversation summary."
-                        }], run_llm=True)
-                    ])
-            
-            # USE CASE 3: Error recovery with helpful suggestions
-            if isinstance(frame, ErrorFrame):
+        # USE CASE 2: Track conversation flow and offer summaries
+        async def _on_llm_response_end(self, frame: Frame):
+            self.conversation_turns += 1
+            if self.conversation_turns % self.SUMMARY_INTERVAL == 0:
                 await task.queue_frames([
-                    TTSSpeakFrame("I encountered an issue. Let me try a different approach."),
-                    LLMRunFrame()  # Restart conversation
+                    TTSSpeakFrame("Would you like me to summarize our conversation?"),
+                    LLMMessagesAppendFrame([{
+                        "role": "system",
+                        "content": "Ask if the user wants a conversation summary."
+                    }], run_llm=True)
                 ])
-            
+
+        # USE CASE 3: Error recovery with helpful suggestions
+        async def _on_error(self, frame: Frame):
+            await task.queue_frames([
+                TTSSpeakFrame("I encountered an issue. Let me try a different approach."),
+                LLMRunFrame()  # Restart conversation
+            ])
+
+        async def process_frame(self, frame: Frame, direction: FrameDirection):
+            await super().process_frame(frame, direction)
+
+            handler = self._handlers.get(type(frame))
+            if handler:
+                await handler(frame)
+
             await self.push_frame(frame, direction)
 
     smart_processor = SmartProcessor()
@@ -214,7 +266,7 @@ async def main():
         ])
         
         # Simulate database search
-        results = await simulate_db_search(query)
+        results = await asyncio.to_thread(simulate_db_search, query)
         
         if results:
             await task.queue_frames([
@@ -232,13 +284,11 @@ async def main():
         date = params.arguments["date"]
         time = params.arguments["time"]
         
-        # Step 1: Check availability
+        # Nothing is awaited between the two steps, so submit them together
         await task.queue_frames([
+            # Step 1: Check availability
             TTSSpeakFrame("Checking availability..."),
-        ])
-        
-        # Step 2: Confirm booking
-        await task.queue_frames([
+            # Step 2: Confirm booking
             TTSSpeakFrame(f"Great! I've booked your appointment for {date} at {time}."),
             TTSSpeakFrame("You'll receive a confirmation email shortly."),
             LLMMessagesAppendFrame([{
@@ -259,7 +309,7 @@ async def main():
         ])
         
         # Simulate device control
-        success = await control_smart_device("lights", room, action)
+        success = await asyncio.to_thread(control_smart_device, "lights", room, action)
         
         if success:
             await task.queue_frames([
@@ -282,7 +332,7 @@ async def main():
         ])
         
         # Draft email
-        email_sent = await send_email_api(recipient, subject)
+        email_sent = await asyncio.to_thread(send_email_api, recipient, subject)
         
         await task.queue_frames([
             TTSSpeakFrame(f"Email sent to {recipient} with subject '{subject}'."),
@@ -368,14 +418,16 @@ async def main():
     await runner.run(task)
 
 # Helper functions (would be implemented based on your needs)
-async def simulate_db_search(query):
+# These stand in for blocking DB/HTTP/SMTP clients, so handlers run them with
+# asyncio.to_thread() to keep the pipeline's event loop free to move audio.
+def simulate_db_search(query):
     # Simulate database search
     return [{"result": f"Data for {query}"}]
 
-async def control_smart_device(device, room, action):
+def control_smart_device(device, room, action):
     # Simulate smart home control
     return True
 
-async def send_email_api(recipient, subject):
+def send_email_api(recipient, subject):
     # Simulate email sending
     return True
\ No newline at end of file
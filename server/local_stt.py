@@ -0,0 +1,157 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""On-device streaming speech-to-text.
+
+Runs a sherpa-onnx streaming transducer (e.g. the int8 Nemotron/Parakeet
+English models) locally on the CPU, so transcription does not need a network
+round-trip to a cloud STT provider.
+
+Point ``LOCAL_ASR_DIR`` at an unpacked sherpa-onnx model directory containing
+``encoder*.onnx``, ``decoder*.onnx``, ``joiner*.onnx`` and ``tokens.txt``.
+"""
+
+import asyncio
+import glob
+import os
+from functools import lru_cache
+from typing import AsyncGenerator, Optional
+
+import numpy as np
+from loguru import logger
+
+from pipecat.frames.frames import (
+    CancelFrame,
+    EndFrame,
+    ErrorFrame,
+    Frame,
+    InterimTranscriptionFrame,
+    StartFrame,
+    TranscriptionFrame,
+    UserStoppedSpeakingFrame,
+)
+from pipecat.processors.frame_processor import FrameDirection
+from pipecat.services.stt_service import STTService
+from pipecat.utils.time import time_now_iso8601
+
+try:
+    import sherpa_onnx
+except ModuleNotFoundError as e:
+    logger.error(f"Exception: {e}")
+    logger.error("In order to use local speech recognition, you need to `pip install sherpa-onnx`.")
+    raise Exception(f"Missing module: {e}")
+
+
+def _find_model_file(model_dir: str, prefix: str) -> str:
+    """Return the model file for ``prefix``, preferring int8 weights."""
+    candidates = sorted(glob.glob(os.path.join(model_dir, f"{prefix}*.onnx")))
+    if not candidates:
+        raise FileNotFoundError(f"No {prefix}*.onnx model found in {model_dir}")
+    int8 = [c for c in candidates if ".int8." in os.path.basename(c)]
+    return (int8 or candidates)[0]
+
+
+@lru_cache(maxsize=None)
+def get_recognizer(model_dir: str, num_threads: int = 1, provider: str = "cpu"):
+    """Return the recognizer for ``model_dir``, shared by every session.
+
+    The recognizer only holds the model weights; per-session decoding state
+    lives in the stream each service creates from it. Loading reads the weights
+    from disk, so call this once at startup rather than from a running session.
+    """
+    return sherpa_onnx.OnlineRecognizer.from_transducer(
+        tokens=os.path.join(model_dir, "tokens.txt"),
+        encoder=_find_model_file(model_dir, "encoder"),
+        decoder=_find_model_file(model_dir, "decoder"),
+        joiner=_find_model_file(model_dir, "joiner"),
+        num_threads=num_threads,
+        provider=provider,
+        enable_endpoint_detection=True,
+    )
+
+
+class SherpaOnnxSTTService(STTService):
+    """Streaming speech-to-text using a local sherpa-onnx transducer model.
+
+    Audio is fed to the recognizer as it arrives and partial hypotheses are
+    pushed as interim transcriptions. Each utterance is finalized as soon as the
+    VAD reports that the user stopped speaking, rather than waiting for the
+    recognizer's own trailing-silence endpoint rules, which remain as a fallback.
+
+    The model is loaded once per ``model_dir`` through :func:`get_recognizer`;
+    each service only creates its own stream in :meth:`start`.
+    """
+
+    def __init__(
+        self,
+        *,
+        model_dir: str,
+        num_threads: int = 1,
+        provider: str = "cpu",
+        sample_rate: Optional[int] = None,
+        **kwargs,
+    ):
+        super().__init__(sample_rate=sample_rate, **kwargs)
+
+        self._recognizer = get_recognizer(model_dir, num_threads, provider)
+        self._stream = None
+        self._last_text = ""
+
+    async def start(self, frame: StartFrame):
+        await super().start(frame)
+        self._stream = self._recognizer.create_stream()
+        self._last_text = ""
+
+    async def stop(self, frame: EndFrame):
+        await super().stop(frame)
+        self._stream = None
+
+    async def cancel(self, frame: CancelFrame):
+        await super().cancel(frame)
+        self._stream = None
+
+    def _decode(self, audio: bytes) -> tuple[str, bool]:
+        samples = np.frombuffer(audio, dtype=np.int16).astype(np.float32) / 32768.0
+        self._stream.accept_waveform(self.sample_rate, samples)
+        while self._recognizer.is_ready(self._stream):
+            self._recognizer.decode_stream(self._stream)
+        text = self._recognizer.get_result(self._stream).strip()
+        is_endpoint = self._recognizer.is_endpoint(self._stream)
+        if is_endpoint:
+            self._recognizer.reset(self._stream)
+        return text, is_endpoint
+
+    def _finalize(self) -> str:
+        text = self._recognizer.get_result(self._stream).strip()
+        self._recognizer.reset(self._stream)
+        return text
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, UserStoppedSpeakingFrame) and self._stream:
+            text = await asyncio.to_thread(self._finalize)
+            self._last_text = ""
+            if text:
+                logger.debug(f"Transcription: [{text}]")
+                await self.push_frame(TranscriptionFrame(text, self._user_id, time_now_iso8601()))
+
+    async def run_stt(self, audio: bytes) -> AsyncGenerator[Frame, None]:
+        if not self._stream:
+            yield ErrorFrame("Local STT stream is not initialized")
+            return
+
+        # Decoding is CPU-bound, keep it off the event loop.
+        text, is_endpoint = await asyncio.to_thread(self._decode, audio)
+
+        if is_endpoint:
+            self._last_text = ""
+            if text:
+                logger.debug(f"Transcription: [{text}]")
+                yield TranscriptionFrame(text, self._user_id, time_now_iso8601())
+        elif text and text != self._last_text:
+            self._last_text = text
+            yield InterimTranscriptionFrame(text, self._user_id, time_now_iso8601())
@@ -0,0 +1,188 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import sys
+import types
+
+import pytest
+
+pytest.importorskip("pipecat")
+
+
+class FakeStream:
+    def __init__(self):
+        self.waveforms = []
+
+    def accept_waveform(self, sample_rate, samples):
+        self.waveforms.append((sample_rate, samples))
+
+
+class FakeRecognizer:
+    """Stands in for sherpa_onnx.OnlineRecognizer with a scripted hypothesis."""
+
+    def __init__(self):
+        self.text = ""
+        self.endpoint = False
+        self.resets = 0
+
+    def create_stream(self):
+        return FakeStream()
+
+    def is_ready(self, stream):
+        return False
+
+    def decode_stream(self, stream):
+        pass
+
+    def get_result(self, stream):
+        return self.text
+
+    def is_endpoint(self, stream):
+        return self.endpoint
+
+    def reset(self, stream):
+        self.text = ""
+        self.endpoint = False
+        self.resets += 1
+
+
+# sherpa-onnx is an optional dependency, so the tests run against a fake module.
+sherpa_onnx = types.ModuleType("sherpa_onnx")
+sherpa_onnx.OnlineRecognizer = types.SimpleNamespace(
+    from_transducer=lambda **kwargs: FakeRecognizer()
+)
+sys.modules["sherpa_onnx"] = sherpa_onnx
+
+from pipecat.frames.frames import (  # noqa: E402
+    CancelFrame,
+    EndFrame,
+    ErrorFrame,
+    InterimTranscriptionFrame,
+    StartFrame,
+    TranscriptionFrame,
+    UserStoppedSpeakingFrame,
+)
+from pipecat.processors.frame_processor import FrameDirection  # noqa: E402
+
+from local_stt import SherpaOnnxSTTService, _find_model_file, get_recognizer  # noqa: E402
+
+AUDIO = b"\x00\x00" * 160
+
+
+@pytest.fixture
+def model_dir(tmp_path):
+    for name in ("encoder.int8.onnx", "decoder.int8.onnx", "joiner.int8.onnx", "tokens.txt"):
+        (tmp_path / name).touch()
+    return str(tmp_path)
+
+
+async def _started_service(model_dir):
+    service = SherpaOnnxSTTService(model_dir=model_dir)
+    await service.start(StartFrame(audio_in_sample_rate=16000))
+    return service
+
+
+async def _run_stt(service, audio=AUDIO):
+    return [frame async for frame in service.run_stt(audio)]
+
+
+def test_find_model_file_prefers_int8(tmp_path):
+    for name in ("encoder-epoch-99.onnx", "encoder-epoch-99.int8.onnx", "decoder.onnx"):
+        (tmp_path / name).touch()
+
+    expected = tmp_path / "encoder-epoch-99.int8.onnx"
+    assert _find_model_file(str(tmp_path), "encoder") == str(expected)
+
+
+def test_find_model_file_falls_back_to_fp32(tmp_path):
+    (tmp_path / "decoder-epoch-99.onnx").touch()
+
+    assert _find_model_file(str(tmp_path), "decoder") == str(tmp_path / "decoder-epoch-99.onnx")
+
+
+def test_find_model_file_missing(tmp_path):
+    with pytest.raises(FileNotFoundError, match="joiner"):
+        _find_model_file(str(tmp_path), "joiner")
+
+
+def test_sessions_share_recognizer_but_not_stream(model_dir):
+    async def run():
+        return await _started_service(model_dir), await _started_service(model_dir)
+
+    first, second = asyncio.run(run())
+
+    assert first._recognizer is second._recognizer is get_recognizer(model_dir)
+    assert first._stream is not second._stream
+
+
+def test_run_stt_dedupes_interim_text(model_dir):
+    async def run():
+        service = await _started_service(model_dir)
+        service._recognizer.text = "hello"
+        frames = await _run_stt(service) + await _run_stt(service)
+        service._recognizer.text = "hello world"
+        return frames + await _run_stt(service)
+
+    frames = asyncio.run(run())
+
+    assert [type(f) for f in frames] == [InterimTranscriptionFrame, InterimTranscriptionFrame]
+    assert [f.text for f in frames] == ["hello", "hello world"]
+
+
+def test_run_stt_finalizes_and_resets_on_endpoint(model_dir):
+    async def run():
+        service = await _started_service(model_dir)
+        service._recognizer.text = "turn on the lights"
+        interim = await _run_stt(service)
+        service._recognizer.endpoint = True
+        final = await _run_stt(service)
+        return service, interim, final
+
+    service, interim, final = asyncio.run(run())
+
+    assert [f.text for f in interim] == ["turn on the lights"]
+    assert len(final) == 1
+    assert isinstance(final[0], TranscriptionFrame)
+    assert final[0].text == "turn on the lights"
+    assert service._recognizer.resets == 1
+    assert service._last_text == ""
+
+
+def test_user_stopped_speaking_finalizes_utterance(model_dir):
+    async def run():
+        service = await _started_service(model_dir)
+        pushed = []
+
+        async def push_frame(frame, direction=FrameDirection.DOWNSTREAM):
+            pushed.append(frame)
+
+        service.push_frame = push_frame
+        service._recognizer.text = "what time is it"
+        await _run_stt(service)
+        await service.process_frame(UserStoppedSpeakingFrame(), FrameDirection.DOWNSTREAM)
+        return service, pushed
+
+    service, pushed = asyncio.run(run())
+
+    transcriptions = [f for f in pushed if isinstance(f, TranscriptionFrame)]
+    assert [f.text for f in transcriptions] == ["what time is it"]
+    assert service._recognizer.resets == 1
+    assert service._last_text == ""
+
+
+@pytest.mark.parametrize("shutdown, frame_class", [("stop", EndFrame), ("cancel", CancelFrame)])
+def test_run_stt_after_shutdown_reports_error(model_dir, shutdown, frame_class):
+    async def run():
+        service = await _started_service(model_dir)
+        await getattr(service, shutdown)(frame_class())
+        return await _run_stt(service)
+
+    frames = asyncio.run(run())
+
+    assert len(frames) == 1
+    assert isinstance(frames[0], ErrorFrame)
+    assert "not initialized" in frames[0].error